@@ -22,7 +22,7 @@ from src.ui.components import (
     render_weather_card, 
     render_settings_panel,
     render_globe_component,
-    component_manager
+    get_component_manager
 )
 
 # Import utilities
@@ -222,11 +222,11 @@ class SkyGlobeApp:
                     'weather_service': self.weather_service,
                     'geo_service': self.geo_service
                 }
-                component_manager.render_status_panel(services)
-            
+                get_component_manager().render_status_panel(services)
+
             # Help panel
             with st.expander("❓ ヘルプ", expanded=False):
-                component_manager.render_help_panel()
+                get_component_manager().render_help_panel()
                 
         except Exception as e:
             self.logger.error(f"Failed to render status panel: {str(e)}")
@@ -265,36 +265,47 @@ class GeoService:
         """
         if self.cities_df is None:
             return None
-        
+
         try:
-            df = self.cities_df.copy()
-            
-            # Apply continent filter if specified
-            if continent and continent != "すべて":
-                # Map Japanese continent names to English
-                continent_mapping = {
-                    "アジア": "Asia",
-                    "ヨーロッパ": "Europe", 
-                    "北アメリカ": "North America",
-                    "南アメリカ": "South America",
-                    "アフリカ": "Africa",
-                    "オセアニア": "Oceania"
-                }
-                
-                eng_continent = continent_mapping.get(continent, continent)
-                df = df[df['continent'] == eng_continent]
-            
-            if df.empty:
-                return None
-            
-            # Weight selection by population (cities with higher population more likely to be selected)
-            weights = np.sqrt(df['population'])  # Square root to reduce extreme bias
-            weights = weights / weights.sum()
-            
+            # Reuse cached candidate pool so each pick is an O(1) index draw
+            # instead of re-filtering and re-weighting the full catalog
+            pool_key = continent or "すべて"
+            pool = self.cache_manager.get('random_pool', pool_key)
+
+            if pool is None:
+                df = self.cities_df
+
+                # Apply continent filter if specified
+                if continent and continent != "すべて":
+                    # Map Japanese continent names to English
+                    continent_mapping = {
+                        "アジア": "Asia",
+                        "ヨーロッパ": "Europe",
+                        "北アメリカ": "North America",
+                        "南アメリカ": "South America",
+                        "アフリカ": "Africa",
+                        "オセアニア": "Oceania"
+                    }
+
+                    eng_continent = continent_mapping.get(continent, continent)
+                    df = df[df['continent'] == eng_continent]
+
+                if df.empty:
+                    return None
+
+                # Weight selection by population (cities with higher population more likely to be selected)
+                weights = np.sqrt(df['population'])  # Square root to reduce extreme bias
+                weights = weights / weights.sum()
+
+                pool = (df.index.to_numpy(), weights.to_numpy())
+                self.cache_manager.set('random_pool', pool, pool_key)
+
+            indices, weights = pool
+
             # Random selection
-            selected_idx = np.random.choice(df.index, p=weights)
-            city_data = df.loc[selected_idx].to_dict()
-            
+            selected_idx = np.random.choice(indices, p=weights)
+            city_data = self.cities_df.loc[selected_idx].to_dict()
+
             return CityInfo.from_dict(city_data)
             
         except Exception as e:
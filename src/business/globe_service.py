@@ -50,6 +50,15 @@ class GlobeService:
             'weather_snow': [255, 255, 255, 180],   # White for snow
             'weather_storm': [150, 100, 200, 180]   # Purple for storms
         }
+
+        # Elevation multipliers applied to the 50 km base by weather condition
+        self.ELEVATION_FACTORS = {
+            'Thunderstorm': 2.0,   # High for storms
+            'Rain': 1.5,           # Medium for rain
+            'Drizzle': 1.5,
+            'Snow': 1.3,           # Medium-high for snow
+            'Clouds': 1.1          # Slightly higher for clouds
+        }
     
     def create_basic_globe(self, center_city: Optional[CityInfo] = None) -> pdk.Deck:
         """
@@ -178,42 +187,40 @@ class GlobeService:
         try:
             if not weather_data_list:
                 return None
-            
-            # Prepare data
-            data = []
-            for city, weather in weather_data_list:
-                if weather is None:
-                    continue
-                
-                # Determine color based on weather condition
-                color = self._get_weather_color(weather.weather_main)
-                
-                # Size based on temperature (warmer = larger, normalized)
-                temp_normalized = max(0.2, min(2.0, (weather.temperature + 20) / 50))
-                radius = 40000 * temp_normalized
-                
-                # Elevation based on weather intensity
-                elevation = self._get_weather_elevation(weather)
-                
-                data.append({
-                    'city_id': city.id,
-                    'city_name': city.name_ja,
-                    'country': city.country_ja,
-                    'latitude': city.latitude,
-                    'longitude': city.longitude,
-                    'temperature': weather.temperature,
-                    'weather': weather.weather_description,
-                    'weather_main': weather.weather_main,
-                    'icon': weather.weather_icon,
-                    'color': color,
-                    'radius': radius,
-                    'elevation': elevation
-                })
-            
+
+            # Build a columnar (SoA) payload in a single pass; pydeck consumes
+            # the DataFrame directly without a per-city dict list
+            records = [
+                (city.id, city.name_ja, city.country_ja, city.latitude, city.longitude,
+                 weather.temperature, weather.weather_description, weather.weather_main,
+                 weather.weather_icon)
+                for city, weather in weather_data_list
+                if weather is not None
+            ]
+
+            if not records:
+                return None
+
+            df = pd.DataFrame.from_records(records, columns=[
+                'city_id', 'city_name', 'country', 'latitude', 'longitude',
+                'temperature', 'weather', 'weather_main', 'icon'
+            ])
+
+            # Vectorized styling instead of per-city Python loops:
+            # color by weather condition
+            df['color'] = df['weather_main'].map(self._get_weather_color)
+
+            # Size based on temperature (warmer = larger, normalized)
+            temp_normalized = np.clip((df['temperature'] + 20) / 50, 0.2, 2.0)
+            df['radius'] = 40000 * temp_normalized
+
+            # Elevation based on weather intensity
+            df['elevation'] = 50000 * df['weather_main'].map(self.ELEVATION_FACTORS).fillna(1.0)
+
             # Create ColumnLayer for 3D weather visualization
             layer = pdk.Layer(
                 "ColumnLayer",
-                data=data,
+                data=df,
                 get_position=["longitude", "latitude"],
                 get_color="color",
                 get_radius="radius",
@@ -372,20 +379,9 @@ class GlobeService:
         Returns:
             Elevation in meters
         """
-        # Base elevation
+        # Base elevation, scaled by weather condition
         base_elevation = 50000  # 50km
-        
-        # Adjust based on weather conditions
-        if weather.weather_main in ['Thunderstorm']:
-            return base_elevation * 2  # High for storms
-        elif weather.weather_main in ['Rain', 'Drizzle']:
-            return base_elevation * 1.5  # Medium for rain
-        elif weather.weather_main in ['Snow']:
-            return base_elevation * 1.3  # Medium-high for snow
-        elif weather.weather_main in ['Clouds']:
-            return base_elevation * 1.1  # Slightly higher for clouds
-        else:
-            return base_elevation  # Base for clear weather
+        return base_elevation * self.ELEVATION_FACTORS.get(weather.weather_main, 1.0)
     
     def create_complete_globe(self, 
                             cities: List[CityInfo], 
@@ -6,6 +6,7 @@ Defines dataclasses for city information and weather data.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Tuple, Optional, Dict, Any
 import json
 
@@ -25,7 +26,8 @@ class CityInfo:
     timezone: str
     continent: str
     population: int
-    
+    population_str: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate data after initialization."""
         # Validate coordinates
@@ -39,11 +41,25 @@ class CityInfo:
             raise ValueError("City name (English and Japanese) is required")
         if not self.country_code or len(self.country_code) != 2:
             raise ValueError("Valid 2-letter country code is required")
-    
+
+        # Precompute the mapping tuple once so repeated access (e.g. Pydeck
+        # layer preparation) does not allocate a fresh tuple per call
+        self._coords: Tuple[float, float] = (self.longitude, self.latitude)
+
+        # Precompute display strings so previews re-rendered on every
+        # Streamlit rerun do not repeat the float/int formatting
+        self._coords_str: str = f"{self.latitude:.4f}, {self.longitude:.4f}"
+        self.population_str = f"{self.population:,}"
+
     @property
     def coordinates(self) -> Tuple[float, float]:
         """Get coordinates as (longitude, latitude) tuple for mapping."""
-        return (self.longitude, self.latitude)
+        return self._coords
+
+    @property
+    def coordinates_display(self) -> str:
+        """Get coordinates formatted as 'lat, lon' for display."""
+        return self._coords_str
     
     @property
     def display_name_ja(self) -> str:
@@ -61,7 +77,7 @@ class CityInfo:
             'id': self.id,
             'name': self.name_ja,
             'name_en': self.name_en,
-            'coordinates': [self.longitude, self.latitude],
+            'coordinates': self._coords,
             'lat': self.latitude,
             'lon': self.longitude,
             'country': self.country_ja,
@@ -181,6 +197,23 @@ class WeatherData:
     def weather_icon_url(self) -> str:
         """Get OpenWeatherMap icon URL."""
         return f"https://openweathermap.org/img/wn/{self.weather_icon}@2x.png"
+
+    # strftime is expensive (locale lookups); these run once per instance and
+    # are then plain attribute reads on every rerun
+    @cached_property
+    def sunrise_hhmm(self) -> str:
+        """Get sunrise time formatted as HH:MM."""
+        return self.sunrise.strftime('%H:%M')
+
+    @cached_property
+    def sunset_hhmm(self) -> str:
+        """Get sunset time formatted as HH:MM."""
+        return self.sunset.strftime('%H:%M')
+
+    @cached_property
+    def updated_at_display(self) -> str:
+        """Get update timestamp formatted for display."""
+        return self.updated_at.strftime('%Y-%m-%d %H:%M:%S')
     
     def to_display_dict(self, temp_unit: str = "C", wind_unit: str = "ms") -> Dict[str, Any]:
         """
@@ -228,9 +261,9 @@ class WeatherData:
             'icon_url': self.weather_icon_url,
             'is_day': self.is_day,
             'local_time': self.local_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'sunrise': self.sunrise.strftime('%H:%M'),
-            'sunset': self.sunset.strftime('%H:%M'),
-            'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+            'sunrise': self.sunrise_hhmm,
+            'sunset': self.sunset_hhmm,
+            'updated_at': self.updated_at_display
         }
     
     def to_dict(self) -> Dict[str, Any]:
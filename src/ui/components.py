@@ -11,10 +11,118 @@ import logging
 
 from src.data.data_models import CityInfo, WeatherData
 from src.business.geo_service import GeoService
-from src.business.weather_service import WeatherService
-from src.business.globe_service import GlobeService
 from src.utils.config import config
 
+# WeatherService and GlobeService (which pulls in pydeck) are imported
+# lazily inside their cached factories to keep cold start fast
+
+# Optional debounced input component; falls back to st.text_input when missing
+try:
+    from st_keyup import st_keyup
+except ImportError:
+    st_keyup = None
+
+
+# Static help-panel content, hoisted so it is not rebuilt per render
+_HOW_TO_MD = """
+**1. City Search**
+- Enter a city name to search for specific locations
+- Or use random selection to discover new cities
+
+**2. Weather Information**
+- View current weather data for selected cities
+- Detailed information includes temperature, humidity, wind, and more
+
+**3. 3D Globe Interaction**
+- Explore the interactive 3D globe showing weather patterns
+- Zoom and rotate to view different regions
+- Day/night boundary shows current solar illumination
+
+**4. Settings**
+- Change temperature units (°C/°F) and wind speed units
+- Toggle display options like day/night boundary and city labels
+"""
+
+_TROUBLESHOOTING_MD = """
+**Common Issues:**
+
+- **No weather data displayed**
+  → Check API connection status
+  → Verify internet connectivity
+
+- **3D globe not displaying**
+  → Enable WebGL in your browser
+  → Try refreshing the page
+
+- **City search not working**
+  → Check spelling of city names
+  → Try using English names for international cities
+"""
+
+
+@st.cache_data(ttl=600, max_entries=512, show_spinner=False)
+def _cached_city_search(query: str, limit: int, _geo_service: GeoService) -> List[CityInfo]:
+    """
+    Cached wrapper around GeoService.search_cities.
+
+    Keyed on (query, limit) so repeated queries during interactive typing
+    are served from cache instead of re-scanning the city catalog. The
+    service instance is excluded from the cache key (underscore prefix).
+    """
+    return _geo_service.search_cities(query, limit=limit)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_continent_list(_geo_service: GeoService) -> List[str]:
+    """Cached continent list; the set of continents never changes at runtime."""
+    return _geo_service.get_continent_list()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_api_connection(_weather_service: 'WeatherService') -> bool:
+    """API liveness check, cached so reruns do not re-ping the API."""
+    return _weather_service.test_api_connection()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_service_statistics(_weather_service: 'WeatherService') -> Dict[str, Any]:
+    """Service statistics snapshot, cached briefly between reruns."""
+    return _weather_service.get_statistics()
+
+
+@st.cache_data(ttl=600, max_entries=1024, show_spinner=False)
+def _cached_weather_display(city_id: int, updated_ts: float, temp_unit: str,
+                            _weather_data: WeatherData) -> Dict[str, Any]:
+    """
+    Formatted weather display dict, keyed by (city, update time, unit).
+
+    Weather refreshes at most every few minutes while the script reruns on
+    every interaction, so most reruns become cache hits.
+    """
+    return get_weather_service().format_weather_display(_weather_data, temp_unit)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _cached_globe_deck(cache_key: tuple,
+                       _globe_service: 'GlobeService',
+                       _cities: List[CityInfo],
+                       _weather_data: Dict[int, WeatherData],
+                       _selected_city: Optional[CityInfo],
+                       show_day_night: bool):
+    """
+    Memoized deck construction for the 3D globe.
+
+    Identity is carried entirely by cache_key (city IDs, weather update
+    timestamps, selection, day/night flag); the unhashable inputs are
+    excluded from hashing via the underscore prefix.
+    """
+    return _globe_service.create_complete_globe(
+        cities=_cities,
+        weather_data=_weather_data,
+        selected_city=_selected_city,
+        show_day_night=show_day_night
+    )
+
 
 class ComponentManager:
     """
@@ -56,7 +164,7 @@ class ComponentManager:
             return selected_city
             
         except Exception as e:
-            self.logger.error(f"Failed to render search component: {str(e)}")
+            self.logger.error("Failed to render search component: %s", e)
             st.error("Failed to load search component")
             return None
     
@@ -71,34 +179,62 @@ class ComponentManager:
             Selected CityInfo object or None
         """
         try:
-            # Text input for search
-            search_query = st.text_input(
-                "Enter city name to search",
-                placeholder="Tokyo, London, Paris...",
-                key="city_search_input"
-            )
+            # Text input for search (debounced when st_keyup is available so
+            # searches fire after idle typing instead of on every keystroke)
+            if st_keyup is not None:
+                search_query = st_keyup(
+                    "Enter city name to search",
+                    placeholder="Tokyo, London, Paris...",
+                    debounce=300,
+                    key="city_search_input"
+                )
+            else:
+                search_query = st.text_input(
+                    "Enter city name to search",
+                    placeholder="Tokyo, London, Paris...",
+                    key="city_search_input"
+                )
             
             if search_query and len(search_query) >= config.MIN_SEARCH_LENGTH:
-                # Search for cities
-                with st.spinner("Searching cities..."):
-                    cities = geo_service.search_cities(search_query, limit=config.MAX_SEARCH_RESULTS)
+                # Search for cities (normalized so equivalent queries share a cache entry).
+                # Reruns triggered by unrelated widgets skip even the cache-hit
+                # overhead when the query is unchanged.
+                query_key = search_query.strip().lower()
+
+                if st.session_state.get('_last_search_query') == query_key:
+                    cities = st.session_state['_last_search_results']
+                else:
+                    with st.spinner("Searching cities..."):
+                        cities = _cached_city_search(
+                            query_key,
+                            config.MAX_SEARCH_RESULTS,
+                            geo_service
+                        )
+                    st.session_state['_last_search_query'] = query_key
+                    st.session_state['_last_search_results'] = cities
                 
                 if cities:
-                    # Display search results
-                    city_options = {f"{city.display_name_ja}": city for city in cities}
-                    
-                    selected_name = st.selectbox(
+                    # Cap the rendered option list; very long dropdowns make the
+                    # frontend select widget itself the bottleneck
+                    truncated = len(cities) - config.UI_MAX_DROPDOWN
+                    dropdown_cities = cities[:config.UI_MAX_DROPDOWN]
+
+                    # Display search results; the selectbox returns the chosen
+                    # CityInfo directly, so no label list or lookup is needed
+                    selected_city = st.selectbox(
                         f"Search results ({len(cities)} found)",
-                        options=list(city_options.keys()),
+                        options=dropdown_cities,
+                        format_func=lambda c: c.display_name_ja,
                         key="city_selectbox"
                     )
-                    
-                    if selected_name:
-                        selected_city = city_options[selected_name]
-                        
+
+                    if truncated > 0:
+                        st.caption(f"…{truncated} more — refine your query to narrow results")
+
+                    if selected_city is not None:
                         # Show city details
                         self._render_city_preview(selected_city)
-                        
+
                         return selected_city
                 else:
                     st.warning(f"No cities found for '{search_query}'")
@@ -109,7 +245,7 @@ class ComponentManager:
             return None
             
         except Exception as e:
-            self.logger.error(f"Failed to render city search: {str(e)}")
+            self.logger.error("Failed to render city search: %s", e)
             st.error("City search failed")
             return None
     
@@ -125,7 +261,7 @@ class ComponentManager:
         """
         try:
             # Continent filter
-            continents = geo_service.get_continent_list()
+            continents = _cached_continent_list(geo_service)
             selected_continent = st.selectbox(
                 "Select continent filter",
                 options=continents,
@@ -159,7 +295,7 @@ class ComponentManager:
             return None
             
         except Exception as e:
-            self.logger.error(f"Failed to render random selection: {str(e)}")
+            self.logger.error("Failed to render random selection: %s", e)
             st.error("Random selection failed")
             return None
     
@@ -173,19 +309,22 @@ class ComponentManager:
         try:
             with st.expander("City Information", expanded=True):
                 col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown(f"**City Name:** {city.name_ja}")
-                    st.markdown(f"**Country:** {city.country_ja}")
-                    st.markdown(f"**Continent:** {city.continent}")
-                
-                with col2:
-                    st.markdown(f"**Coordinates:** {city.latitude:.4f}, {city.longitude:.4f}")
-                    st.markdown(f"**Timezone:** {city.timezone}")
-                    st.markdown(f"**Population:** {city.population:,}")
+
+                # One markdown blob per column — each st.markdown call is a
+                # separate delta message to the frontend
+                col1.markdown(
+                    f"**City Name:** {city.name_ja}  \n"
+                    f"**Country:** {city.country_ja}  \n"
+                    f"**Continent:** {city.continent}"
+                )
+                col2.markdown(
+                    f"**Coordinates:** {city.coordinates_display}  \n"
+                    f"**Timezone:** {city.timezone}  \n"
+                    f"**Population:** {city.population_str}"
+                )
                     
         except Exception as e:
-            self.logger.error(f"Failed to render city preview: {str(e)}")
+            self.logger.error("Failed to render city preview: %s", e)
     
     def render_weather_card(self, weather_data: WeatherData, temp_unit: str = "C") -> None:
         """
@@ -198,9 +337,13 @@ class ComponentManager:
         try:
             st.markdown("### Weather Information")
             
-            # Format weather data for display
-            weather_service = WeatherService()
-            formatted_data = weather_service.format_weather_display(weather_data, temp_unit)
+            # Format weather data for display (cached on update time and unit)
+            formatted_data = _cached_weather_display(
+                weather_data.city_id,
+                weather_data.updated_at.timestamp(),
+                temp_unit,
+                weather_data
+            )
             
             # Main weather info
             col1, col2, col3 = st.columns(3)
@@ -227,22 +370,23 @@ class ComponentManager:
             # Additional details in expandable section
             with st.expander("Detailed Information", expanded=False):
                 detail_col1, detail_col2 = st.columns(2)
-                
-                with detail_col1:
-                    st.markdown(f"**Humidity:** {weather_data.humidity}%")
-                    st.markdown(f"**Wind Speed:** {weather_data.wind_speed} m/s")
-                    st.markdown(f"**Visibility:** {weather_data.visibility/1000:.1f} km")
-                
-                with detail_col2:
-                    st.markdown(f"**Pressure:** {weather_data.pressure} hPa")
-                    st.markdown(f"**Sunrise:** {weather_data.sunrise.strftime('%H:%M')}")
-                    st.markdown(f"**Sunset:** {weather_data.sunset.strftime('%H:%M')}")
-            
+
+                detail_col1.markdown(
+                    f"**Humidity:** {weather_data.humidity}%  \n"
+                    f"**Wind Speed:** {weather_data.wind_speed} m/s  \n"
+                    f"**Visibility:** {weather_data.visibility/1000:.1f} km"
+                )
+                detail_col2.markdown(
+                    f"**Pressure:** {weather_data.pressure} hPa  \n"
+                    f"**Sunrise:** {weather_data.sunrise_hhmm}  \n"
+                    f"**Sunset:** {weather_data.sunset_hhmm}"
+                )
+
             # Update time
-            st.caption(f"Last updated: {weather_data.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            st.caption(f"Last updated: {weather_data.updated_at_display}")
             
         except Exception as e:
-            self.logger.error(f"Failed to render weather card: {str(e)}")
+            self.logger.error("Failed to render weather card: %s", e)
             st.error("Failed to display weather information")
     
     def render_settings_panel(self) -> Dict[str, Any]:
@@ -254,33 +398,35 @@ class ComponentManager:
         """
         try:
             st.markdown("### Settings")
-            
+
             settings = {}
-            
-            # Temperature unit setting
-            temp_unit = st.radio(
-                "Temperature Unit",
-                ["°C (Celsius)", "°F (Fahrenheit)"],
-                horizontal=True,
-                key="temp_unit_setting"
-            )
-            settings['temp_unit'] = "C" if "°C" in temp_unit else "F"
-            
-            # Wind speed unit setting
-            wind_unit = st.selectbox(
-                "Wind Speed Unit",
-                ["m/s (Meters per second)", "km/h (Kilometers per hour)", "mph (Miles per hour)"],
-                key="wind_unit_setting"
-            )
-            settings['wind_unit'] = wind_unit.split()[0]
-            
-            # Display options
-            st.markdown("**Display Options**")
-            settings['show_day_night'] = st.checkbox("Show day/night boundary", value=True, key="show_terminator")
-            settings['show_city_labels'] = st.checkbox("Show city labels", value=True, key="show_labels")
-            settings['auto_refresh'] = st.checkbox("Auto refresh", value=False, key="auto_refresh")
-            
-            if settings['auto_refresh']:
+
+            # Batch the widgets in a form so toggling several options causes
+            # one rerun on submit instead of one rerun per widget
+            with st.form("settings_form", clear_on_submit=False):
+                # Temperature unit setting
+                temp_unit = st.radio(
+                    "Temperature Unit",
+                    ["°C (Celsius)", "°F (Fahrenheit)"],
+                    horizontal=True,
+                    key="temp_unit_setting"
+                )
+                settings['temp_unit'] = "C" if temp_unit.startswith("°C") else "F"
+
+                # Wind speed unit setting
+                wind_unit = st.selectbox(
+                    "Wind Speed Unit",
+                    ["m/s (Meters per second)", "km/h (Kilometers per hour)", "mph (Miles per hour)"],
+                    key="wind_unit_setting"
+                )
+                settings['wind_unit'] = wind_unit.split()[0]
+
+                # Display options
+                st.markdown("**Display Options**")
+                settings['show_day_night'] = st.checkbox("Show day/night boundary", value=True, key="show_terminator")
+                settings['show_city_labels'] = st.checkbox("Show city labels", value=True, key="show_labels")
+                settings['auto_refresh'] = st.checkbox("Auto refresh", value=False, key="auto_refresh")
+
                 settings['refresh_interval'] = st.slider(
                     "Refresh interval (minutes)",
                     min_value=1,
@@ -288,29 +434,31 @@ class ComponentManager:
                     value=10,
                     key="refresh_interval"
                 )
-            
-            # Advanced settings in expandable section
-            with st.expander("Advanced Settings", expanded=False):
-                settings['globe_quality'] = st.selectbox(
-                    "Globe display quality",
-                    ["Low", "Medium", "High"],
-                    index=1,
-                    key="globe_quality"
-                )
-                
-                settings['animation_speed'] = st.slider(
-                    "Animation speed",
-                    min_value=0.1,
-                    max_value=2.0,
-                    value=1.0,
-                    step=0.1,
-                    key="animation_speed"
-                )
-            
+
+                # Advanced settings in expandable section
+                with st.expander("Advanced Settings", expanded=False):
+                    settings['globe_quality'] = st.selectbox(
+                        "Globe display quality",
+                        ["Low", "Medium", "High"],
+                        index=1,
+                        key="globe_quality"
+                    )
+
+                    settings['animation_speed'] = st.slider(
+                        "Animation speed",
+                        min_value=0.1,
+                        max_value=2.0,
+                        value=1.0,
+                        step=0.1,
+                        key="animation_speed"
+                    )
+
+                st.form_submit_button("Apply")
+
             return settings
             
         except Exception as e:
-            self.logger.error(f"Failed to render settings panel: {str(e)}")
+            self.logger.error("Failed to render settings panel: %s", e)
             st.error("Failed to load settings")
             return {}
     
@@ -332,15 +480,31 @@ class ComponentManager:
             if not settings:
                 settings = {'show_day_night': True}
             
-            # Create globe service and render
-            globe_service = GlobeService()
-            
+            # Reuse the shared globe service instance
+            globe_service = get_globe_service()
+            show_day_night = settings.get('show_day_night', True)
+
+            # Cheap content fingerprint: rebuilding pydeck layers is the most
+            # expensive step on this path, so reruns with unchanged inputs
+            # reuse the memoized deck
+            cache_key = (
+                tuple(city.id for city in cities),
+                tuple(sorted(
+                    (city_id, weather.updated_at.timestamp())
+                    for city_id, weather in weather_data.items()
+                )),
+                selected_city.id if selected_city else None,
+                show_day_night
+            )
+
             with st.spinner("Loading 3D globe..."):
-                globe_deck = globe_service.create_complete_globe(
-                    cities=cities,
-                    weather_data=weather_data,
-                    selected_city=selected_city,
-                    show_day_night=settings.get('show_day_night', True)
+                globe_deck = _cached_globe_deck(
+                    cache_key,
+                    globe_service,
+                    cities,
+                    weather_data,
+                    selected_city,
+                    show_day_night
                 )
             
             # Display the globe
@@ -350,7 +514,7 @@ class ComponentManager:
             self._render_globe_controls(globe_service, selected_city)
             
         except Exception as e:
-            self.logger.error(f"Failed to render globe component: {str(e)}")
+            self.logger.error("Failed to render globe component: %s", e)
             st.error("Failed to display 3D globe")
             
             # Show fallback message
@@ -358,7 +522,7 @@ class ComponentManager:
             if selected_city:
                 self._render_city_preview(selected_city)
     
-    def _render_globe_controls(self, globe_service: GlobeService, selected_city: Optional[CityInfo]) -> None:
+    def _render_globe_controls(self, globe_service: 'GlobeService', selected_city: Optional[CityInfo]) -> None:
         """
         Render controls for the globe component.
         
@@ -383,7 +547,7 @@ class ComponentManager:
                         st.info(f"Focused on {selected_city.name_ja}")
                         
         except Exception as e:
-            self.logger.error(f"Failed to render globe controls: {str(e)}")
+            self.logger.error("Failed to render globe controls: %s", e)
     
     def render_status_panel(self, services: Dict[str, Any]) -> None:
         """
@@ -395,45 +559,44 @@ class ComponentManager:
         try:
             st.markdown("### System Status")
             
-            # API status
+            # API status (cached so reruns do not trigger extra HTTP round-trips)
             weather_service = services.get('weather_service')
             if weather_service:
-                api_connected = weather_service.test_api_connection()
+                api_connected = _cached_api_connection(weather_service)
                 status_color = "🟢" if api_connected else "🔴"
                 status_text = "Connected" if api_connected else "Disconnected"
-                
+
                 st.markdown(f"**API Status:** {status_color} {status_text}")
-                
+
                 # Get service statistics
-                stats = weather_service.get_service_statistics()
-                
+                stats = _cached_service_statistics(weather_service)
+
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
-                
+
                 with col1:
                     st.metric(
                         "API Calls",
-                        stats['weather_service']['api_calls'],
-                        help="Total API calls made today"
+                        stats['api_stats']['total_requests'],
+                        help="Total API calls made by this process"
                     )
-                
+
                 with col2:
                     st.metric(
                         "Cache Hit Rate",
-                        f"{stats['weather_service']['cache_hit_rate_percent']}%",
+                        f"{stats['cache_stats']['hit_rate_percent']}%",
                         help="Percentage of requests served from cache"
                     )
-                
+
                 with col3:
-                    api_remaining = stats['api_client']['requests_remaining']
                     st.metric(
-                        "API Quota Remaining",
-                        api_remaining,
-                        help="Remaining API requests for today"
+                        "API Errors",
+                        stats['api_stats']['error_count'],
+                        help="Failed API requests for this process"
                     )
             
         except Exception as e:
-            self.logger.error(f"Failed to render status panel: {str(e)}")
+            self.logger.error("Failed to render status panel: %s", e)
             st.error("Failed to display system status")
     
     def render_help_panel(self) -> None:
@@ -442,69 +605,62 @@ class ComponentManager:
             st.markdown("### Help")
             
             with st.expander("How to Use", expanded=False):
-                st.markdown("""
-                **1. City Search**
-                - Enter a city name to search for specific locations
-                - Or use random selection to discover new cities
-                
-                **2. Weather Information**
-                - View current weather data for selected cities
-                - Detailed information includes temperature, humidity, wind, and more
-                
-                **3. 3D Globe Interaction**
-                - Explore the interactive 3D globe showing weather patterns
-                - Zoom and rotate to view different regions
-                - Day/night boundary shows current solar illumination
-                
-                **4. Settings**
-                - Change temperature units (°C/°F) and wind speed units
-                - Toggle display options like day/night boundary and city labels
-                """)
-            
+                st.markdown(_HOW_TO_MD)
+
             with st.expander("Troubleshooting", expanded=False):
-                st.markdown("""
-                **Common Issues:**
-                
-                - **No weather data displayed**
-                  → Check API connection status
-                  → Verify internet connectivity
-                
-                - **3D globe not displaying**
-                  → Enable WebGL in your browser
-                  → Try refreshing the page
-                
-                - **City search not working**
-                  → Check spelling of city names
-                  → Try using English names for international cities
-                """)
+                st.markdown(_TROUBLESHOOTING_MD)
                 
         except Exception as e:
-            self.logger.error(f"Failed to render help panel: {str(e)}")
+            self.logger.error("Failed to render help panel: %s", e)
 
 
-# Global component manager instance
-component_manager = ComponentManager()
+# Cached singleton accessors so managers and services are built once per
+# process instead of being re-instantiated on every rerun
+@st.cache_resource(show_spinner=False)
+def get_component_manager() -> ComponentManager:
+    """Get shared ComponentManager instance."""
+    return ComponentManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_weather_service() -> 'WeatherService':
+    """Get shared WeatherService instance for component rendering."""
+    from src.business.weather_service import WeatherService
+    return WeatherService()
+
+
+@st.cache_resource(show_spinner=False)
+def get_globe_service() -> 'GlobeService':
+    """Get shared GlobeService instance for globe rendering."""
+    from src.business.globe_service import GlobeService
+    return GlobeService()
 
 
 # Convenience functions for common components
 def render_search_component(geo_service: GeoService) -> Optional[CityInfo]:
     """Render city search component."""
-    return component_manager.render_search_component(geo_service)
+    return get_component_manager().render_search_component(geo_service)
 
 
 def render_weather_card(weather_data: WeatherData, temp_unit: str = "C") -> None:
     """Render weather information card."""
-    component_manager.render_weather_card(weather_data, temp_unit)
+    get_component_manager().render_weather_card(weather_data, temp_unit)
 
 
 def render_settings_panel() -> Dict[str, Any]:
     """Render application settings panel."""
-    return component_manager.render_settings_panel()
+    return get_component_manager().render_settings_panel()
 
 
-def render_globe_component(cities: List[CityInfo], 
+@st.fragment
+def render_globe_component(cities: List[CityInfo],
                          weather_data: Dict[int, WeatherData],
                          selected_city: Optional[CityInfo] = None,
                          settings: Dict[str, Any] = None) -> None:
-    """Render 3D globe component."""
-    component_manager.render_globe_component(cities, weather_data, selected_city, settings)
\ No newline at end of file
+    """
+    Render 3D globe component.
+
+    Declared as a fragment so interactions with the globe controls rerun
+    only this section instead of the whole script.
+    """
+    get_component_manager().render_globe_component(cities, weather_data, selected_city, settings)
\ No newline at end of file
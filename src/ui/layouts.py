@@ -6,46 +6,126 @@ Defines page layouts, column structures, and responsive design elements.
 
 import streamlit as st
 from typing import Optional, Dict, Any, Callable
+import functools
 import logging
 
 from src.ui.styles import apply_custom_styles, get_main_header_html
 from src.utils.config import config
 
 
+# Static page chrome, built once at import instead of on every rerun
+_HEADER_HTML = get_main_header_html()
+
+_FOOTER_HTML = """
+<div style='text-align: center; color: #666; font-size: 0.8em;'>
+    <p>🌍 Sky Globe - Powered by OpenWeatherMap API</p>
+    <p>Made with ❤️ using Streamlit and Pydeck</p>
+</div>
+"""
+
+
+# Bind the element calls made inside per-rerun loops once at import; a
+# module-level name skips the attribute lookup on the streamlit module that
+# st.markdown/st.metric would do on every iteration
+_st_markdown = st.markdown
+_st_metric = st.metric
+
+# Icon per panel type for render_info_panel; hoisted so the dict literal is
+# not rebuilt on every call
+_PANEL_ICONS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌"
+}
+
+
+def _render_dict_content(content: Dict[str, Any]) -> None:
+    """Render a dict panel body as one batched markdown delta."""
+    _st_markdown("\n\n".join(f"**{k}:** {v}" for k, v in content.items()))
+
+
+# Type-keyed dispatch for render_info_panel bodies; st.write handles the rest
+_CONTENT_RENDERERS = {
+    dict: _render_dict_content,
+    str: _st_markdown,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _format_panel_header(icon: str, title: str) -> str:
+    """Memoized panel heading markdown; panel titles repeat across reruns."""
+    return f"### {icon} {title}"
+
+
+# Only a handful of sidebar widths occur in practice, so a small cache is
+# enough and returns the identical tuple object for repeat widths
+@functools.lru_cache(maxsize=8)
+def _column_spec(sidebar_width: float) -> tuple:
+    """
+    Memoized column ratio for ``render_main_layout``.
+
+    The DeltaGenerators returned by ``st.columns`` are tied to a single
+    script run and cannot be reused across reruns, but the ratio list fed
+    into ``st.columns`` is pure and worth caching per width.
+    """
+    return (sidebar_width, 1.0 - sidebar_width)
+
+
+def _safe_render(fn):
+    """
+    Log-and-continue guard for render methods.
+
+    Sets up the try/except machinery once per function instead of inlining
+    it at every call site; methods that need a bespoke fallback keep their
+    own handler.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        except Exception as e:
+            self.logger.error("%s failed: %s", fn.__name__, e)
+    return wrapper
+
+
 class LayoutManager:
     """
     Manager for application layouts and responsive design.
     """
-    
-    def __init__(self):
-        """Initialize layout manager."""
-        self.logger = logging.getLogger(__name__)
-    
+
+    logger = logging.getLogger(__name__)
+
+
+    @_safe_render
     def setup_page_config(self, title: str = "Sky Globe - Global Weather") -> None:
         """
         Setup Streamlit page configuration.
-        
+
         Args:
             title: Page title
         """
-        try:
-            st.set_page_config(
-                page_title=title,
-                page_icon="🌍",
-                layout="wide",
-                initial_sidebar_state="expanded",
-                menu_items={
-                    'Get Help': 'https://github.com/your-repo/sky-globe',
-                    'Report a bug': 'https://github.com/your-repo/sky-globe/issues',
-                    'About': "# Sky Globe\nGlobal weather visualization web application"
-                }
-            )
-            
-            # Apply custom styles
-            apply_custom_styles()
-            
-        except Exception as e:
-            self.logger.error(f"Failed to setup page config: {str(e)}")
+        # set_page_config may only run once per session and re-injecting the
+        # CSS on every rerun is wasted work, so guard with a session flag
+        if st.session_state.get('_page_configured'):
+            return
+
+        st.set_page_config(
+            page_title=title,
+            page_icon="🌍",
+            layout="wide",
+            initial_sidebar_state="expanded",
+            menu_items={
+                'Get Help': 'https://github.com/your-repo/sky-globe',
+                'Report a bug': 'https://github.com/your-repo/sky-globe/issues',
+                'About': "# Sky Globe\nGlobal weather visualization web application"
+            }
+        )
+
+        # Apply custom styles
+        apply_custom_styles()
+
+        st.session_state['_page_configured'] = True
     
     def render_header(self, show_stats: bool = False) -> None:
         """
@@ -56,7 +136,7 @@ class LayoutManager:
         """
         try:
             # Main header
-            st.markdown(get_main_header_html(), unsafe_allow_html=True)
+            st.markdown(_HEADER_HTML, unsafe_allow_html=True)
             
             # Optional stats display
             if show_stats and config.is_debug():
@@ -80,8 +160,7 @@ class LayoutManager:
         """
         try:
             # Create responsive columns
-            col_ratios = [sidebar_width, 1 - sidebar_width]
-            col1, col2 = st.columns(col_ratios)
+            col1, col2 = st.columns(_column_spec(sidebar_width))
             
             # Render sidebar content
             with col1:
@@ -103,32 +182,30 @@ class LayoutManager:
             if main_content:
                 main_content()
     
+    @_safe_render
     def render_two_column_layout(self,
                                 left_content: Callable = None,
                                 right_content: Callable = None,
                                 column_ratio: tuple = (1, 1)) -> None:
         """
         Render a two-column layout.
-        
+
         Args:
             left_content: Function to render left column content
             right_content: Function to render right column content
             column_ratio: Ratio between columns (left, right)
         """
-        try:
-            col1, col2 = st.columns(column_ratio)
-            
-            with col1:
-                if left_content:
-                    left_content()
-            
-            with col2:
-                if right_content:
-                    right_content()
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render two-column layout: {str(e)}")
+        col1, col2 = st.columns(column_ratio)
+
+        with col1:
+            if left_content:
+                left_content()
+
+        with col2:
+            if right_content:
+                right_content()
     
+    @_safe_render
     def render_three_column_layout(self,
                                   left_content: Callable = None,
                                   center_content: Callable = None,
@@ -136,30 +213,26 @@ class LayoutManager:
                                   column_ratio: tuple = (1, 2, 1)) -> None:
         """
         Render a three-column layout.
-        
+
         Args:
             left_content: Function to render left column content
             center_content: Function to render center column content
             right_content: Function to render right column content
             column_ratio: Ratio between columns (left, center, right)
         """
-        try:
-            col1, col2, col3 = st.columns(column_ratio)
-            
-            with col1:
-                if left_content:
-                    left_content()
-            
-            with col2:
-                if center_content:
-                    center_content()
-            
-            with col3:
-                if right_content:
-                    right_content()
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render three-column layout: {str(e)}")
+        col1, col2, col3 = st.columns(column_ratio)
+
+        with col1:
+            if left_content:
+                left_content()
+
+        with col2:
+            if center_content:
+                center_content()
+
+        with col3:
+            if right_content:
+                right_content()
     
     def render_tabs_layout(self, 
                           tab_config: Dict[str, Callable],
@@ -178,17 +251,25 @@ class LayoutManager:
             if not tab_config:
                 return ""
             
-            tab_names = list(tab_config.keys())
-            
+            items = list(tab_config.items())
+            tab_names = [name for name, _ in items]
+
+            # A single tab doesn't need a tab bar; render the content inline
+            if len(items) == 1:
+                content_func = items[0][1]
+                if content_func:
+                    content_func()
+                return tab_names[0]
+
             # Create tabs
             tabs = st.tabs(tab_names)
-            
+
             # Render each tab's content
-            for i, (tab_name, content_func) in enumerate(tab_config.items()):
-                with tabs[i]:
+            for tab, (tab_name, content_func) in zip(tabs, items):
+                with tab:
                     if content_func:
                         content_func()
-            
+
             # Return the first tab name as default (Streamlit doesn't expose selected tab)
             return tab_names[0]
             
@@ -196,7 +277,8 @@ class LayoutManager:
             self.logger.error(f"Failed to render tabs layout: {str(e)}")
             return ""
     
-    def render_expandable_section(self, 
+    @_safe_render
+    def render_expandable_section(self,
                                 title: str, 
                                 content_func: Callable,
                                 expanded: bool = False) -> None:
@@ -208,142 +290,110 @@ class LayoutManager:
             content_func: Function to render section content
             expanded: Whether section is expanded by default
         """
-        try:
-            with st.expander(title, expanded=expanded):
-                if content_func:
-                    content_func()
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render expandable section '{title}': {str(e)}")
+        with st.expander(title, expanded=expanded):
+            if content_func:
+                content_func()
     
+    @_safe_render
     def render_metric_cards(self, metrics: Dict[str, Dict[str, Any]], cols: int = 3) -> None:
         """
         Render metrics as cards in a grid layout.
-        
+
         Args:
             metrics: Dictionary with metric data
             cols: Number of columns for the grid
         """
-        try:
-            if not metrics:
-                return
-            
-            # Create columns for metrics
-            metric_cols = st.columns(cols)
-            
-            for i, (metric_name, metric_data) in enumerate(metrics.items()):
-                col_idx = i % cols
-                
-                with metric_cols[col_idx]:
-                    value = metric_data.get('value', 'N/A')
-                    delta = metric_data.get('delta')
-                    help_text = metric_data.get('help', '')
-                    
-                    st.metric(
-                        label=metric_name,
-                        value=value,
-                        delta=delta,
-                        help=help_text
-                    )
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render metric cards: {str(e)}")
+        if not metrics:
+            return
+
+        # Normalize to tuples up front so the render loop does no dict lookups
+        normalized = [
+            (name, data.get('value', 'N/A'), data.get('delta'), data.get('help', ''))
+            for name, data in metrics.items()
+        ]
+
+        # Create columns for metrics
+        metric_cols = st.columns(cols)
+
+        for i, (metric_name, value, delta, help_text) in enumerate(normalized):
+            with metric_cols[i % cols]:
+                _st_metric(
+                    label=metric_name,
+                    value=value,
+                    delta=delta,
+                    help=help_text
+                )
     
-    def render_info_panel(self, 
+    @_safe_render
+    def render_info_panel(self,
                          title: str,
                          content: Dict[str, Any],
                          panel_type: str = "info") -> None:
         """
         Render an information panel.
-        
+
         Args:
             title: Panel title
             content: Panel content dictionary
             panel_type: Type of panel (info, success, warning, error)
         """
-        try:
-            # Panel styling based on type
-            panel_styles = {
-                "info": "ℹ️",
-                "success": "✅", 
-                "warning": "⚠️",
-                "error": "❌"
-            }
-            
-            icon = panel_styles.get(panel_type, "📋")
-            
-            # Create container for the panel
-            with st.container():
-                st.markdown(f"### {icon} {title}")
-                
-                # Render content
-                if isinstance(content, dict):
-                    for key, value in content.items():
-                        st.markdown(f"**{key}:** {value}")
-                elif isinstance(content, str):
-                    st.markdown(content)
-                else:
-                    st.write(content)
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render info panel '{title}': {str(e)}")
+        icon = _PANEL_ICONS.get(panel_type, "📋")
+
+        # Create container for the panel
+        with st.container():
+            st.markdown(_format_panel_header(icon, title))
+
+            # Type-dispatched body render; dicts batch into a single delta
+            _CONTENT_RENDERERS.get(type(content), st.write)(content)
     
-    def render_loading_placeholder(self, message: str = "Loading...") -> None:
+    @_safe_render
+    def render_loading_placeholder(self, message: str = "Loading..."):
         """
         Render a loading placeholder.
-        
+
         Args:
             message: Loading message
+
+        Returns:
+            The st.empty placeholder, so callers can overwrite or clear it
         """
-        try:
-            with st.empty():
-                st.info(f"🔄 {message}")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to render loading placeholder: {str(e)}")
+        placeholder = st.empty()
+        placeholder.info(f"🔄 {message}")
+        return placeholder
     
-    def render_error_message(self, 
-                           error_msg: str, 
+    @_safe_render
+    def render_error_message(self,
+                           error_msg: str,
                            details: Optional[str] = None,
                            show_details: bool = False) -> None:
         """
         Render an error message with optional details.
-        
+
         Args:
             error_msg: Main error message
             details: Additional error details
             show_details: Whether to show details by default
         """
-        try:
-            st.error(f"❌ {error_msg}")
-            
-            if details and show_details:
-                with st.expander("Error Details", expanded=False):
-                    st.code(details)
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render error message: {str(e)}")
+        st.error(f"❌ {error_msg}")
+
+        if details and show_details:
+            with st.expander("Error Details", expanded=False):
+                st.code(details)
     
+    @_safe_render
+    @st.fragment
     def render_footer(self) -> None:
         """Render application footer."""
-        try:
-            st.markdown("---")
-            
-            col1, col2, col3 = st.columns([1, 2, 1])
-            
-            with col2:
-                st.markdown(
-                    """
-                    <div style='text-align: center; color: #666; font-size: 0.8em;'>
-                        <p>🌍 Sky Globe - Powered by OpenWeatherMap API</p>
-                        <p>Made with ❤️ using Streamlit and Pydeck</p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-                
-        except Exception as e:
-            self.logger.error(f"Failed to render footer: {str(e)}")
+        st.markdown("---")
+
+        _, center, _ = st.columns([1, 2, 1])
+
+        # The footer is plain HTML, so skip the markdown parser where
+        # st.html exists (Streamlit >= 1.33)
+        if hasattr(center, 'html'):
+            center.html(_FOOTER_HTML)
+        else:
+            center.markdown(_FOOTER_HTML, unsafe_allow_html=True)
     
     def _render_default_sidebar(self) -> None:
         """Render default sidebar content."""
@@ -355,47 +405,49 @@ class LayoutManager:
         st.title("🌍 Global Weather")
         st.info("Use the 3D globe to explore global weather patterns")
     
+    @_safe_render
+    @st.fragment
     def _render_debug_stats(self) -> None:
         """Render debug statistics."""
-        try:
-            with st.expander("🛠 Debug Stats", expanded=False):
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("Environment", config.environment)
-                
-                with col2:
-                    st.metric("Debug Mode", config.is_debug())
-                
-                with col3:
-                    st.metric("Cache TTL", f"{config.cache_ttl_weather}s")
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to render debug stats: {str(e)}")
+        with st.expander("🛠 Debug Stats", expanded=False):
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                st.metric("Environment", config.environment)
+
+            with col2:
+                st.metric("Debug Mode", config.is_debug())
+
+            with col3:
+                st.metric("Cache TTL", f"{config.cache_ttl_weather}s")
 
 
-# Global layout manager instance
-layout_manager = LayoutManager()
+# Shared layout manager instance; cache_resource keeps a single manager
+# across sessions and lazy importers
+@st.cache_resource
+def get_layout_manager() -> LayoutManager:
+    """Get the shared LayoutManager instance."""
+    return LayoutManager()
 
 
 # Convenience functions for common layouts
 def setup_page(title: str = "Sky Globe - Global Weather") -> None:
     """Setup page configuration with custom title."""
-    layout_manager.setup_page_config(title)
+    get_layout_manager().setup_page_config(title)
 
 
 def render_header(show_stats: bool = False) -> None:
     """Render application header."""
-    layout_manager.render_header(show_stats)
+    get_layout_manager().render_header(show_stats)
 
 
 def render_main_layout(sidebar_content: Callable = None,
                       main_content: Callable = None,
                       sidebar_width: float = 0.3) -> None:
     """Render main application layout."""
-    layout_manager.render_main_layout(sidebar_content, main_content, sidebar_width)
+    get_layout_manager().render_main_layout(sidebar_content, main_content, sidebar_width)
 
 
 def render_footer() -> None:
     """Render application footer."""
-    layout_manager.render_footer()
\ No newline at end of file
+    get_layout_manager().render_footer()
\ No newline at end of file
@@ -2,52 +2,518 @@
 """
 Styling and theme management for Sky Globe application.
 Defines custom CSS, dark theme, animations, and visual components.
+
+The stylesheet only keeps rules with a producer in this repo. Classes
+emitted by the HTML helpers and components: main-header, subtitle,
+fade-in, weather-card, scale-in, weather-icon, status-online,
+status-offline. Dropped as unreferenced: search-container,
+metric-container, globe-container, tooltip/tooltiptext, slide-in-left,
+pulse (the @keyframes pulse animation stays; status-online::before uses
+it). Re-add a rule here when introducing a producer for it.
 """
 
-import streamlit as st
+from __future__ import annotations
+
+import functools
+import gzip
+import json
+import re
+import types
+from pathlib import Path
 from typing import Dict, Any
+
+import streamlit as st
+import streamlit.components.v1 as components
 import logging
 
 
+# Color palette, shared by all StyleManager instances; the read-only view is
+# what instances and callers see, writes go through set_theme_color
+_PALETTE = {
+    # Primary colors
+    'primary': '#FF6B35',
+    'secondary': '#F7931E',
+    'accent': '#FFD23F',
+
+    # Background colors
+    'background_dark': '#0E1117',
+    'background_secondary': '#262730',
+    'background_light': '#FAFAFA',
+
+    # Text colors
+    'text_primary': '#FAFAFA',
+    'text_secondary': '#CCCCCC',
+    'text_muted': '#888888',
+
+    # Status colors
+    'success': '#00C851',
+    'warning': '#FF8800',
+    'error': '#FF4444',
+    'info': '#33B5E5',
+
+    # Weather colors
+    'weather_clear': '#FFD700',
+    'weather_clouds': '#C0C0C0',
+    'weather_rain': '#4169E1',
+    'weather_snow': '#F0F8FF',
+    'weather_storm': '#8A2BE2'
+}
+_PALETTE_VIEW = types.MappingProxyType(_PALETTE)
+
+
+# Async Google Fonts load. An @import inside the stylesheet would block CSS
+# parsing until the font CSS arrived; preconnect plus the media="print"
+# swap trick fetches it off the critical path instead
+_FONT_SNIPPET = (
+    "var p = parent.document.createElement('link');"
+    "p.rel = 'preconnect';"
+    "p.href = 'https://fonts.gstatic.com';"
+    "p.crossOrigin = 'anonymous';"
+    "parent.document.head.appendChild(p);"
+    "var f = parent.document.createElement('link');"
+    "f.rel = 'stylesheet';"
+    "f.href = 'https://fonts.googleapis.com/css2"
+    "?family=Inter:wght@300;400;500;600;700&display=swap';"
+    "f.media = 'print';"
+    "f.onload = function() { this.media = 'all'; };"
+    "parent.document.head.appendChild(f);"
+)
+
+
+# Static asset location; Streamlit serves ./static under app/static when
+# server.enableStaticServing is on, letting the browser cache the stylesheet
+_STATIC_DIR = Path(__file__).resolve().parents[2] / 'static'
+_STATIC_CSS = _STATIC_DIR / 'skyglobe.css'
+
+
+# CSS template with named palette placeholders ({primary} etc.); literal CSS
+# braces are doubled so str.format_map leaves them intact
+_CSS_TEMPLATE = """
+/* Shared glass-surface tokens */
+:root {{
+    --glass: rgba(255, 255, 255, 0.05);
+    --gb: 1px solid rgba(255, 255, 255, 0.1);
+    --r: 10px;
+    --r2: 15px;
+}}
+
+/* Global Styles */
+html, body, [class*="css"] {{
+    font-family: 'Inter', sans-serif;
+}}
+
+/* Hide Streamlit default elements */
+#MainMenu {{visibility: hidden;}}
+.stDeployButton {{display:none;}}
+footer {{visibility: hidden;}}
+.stApp > header {{display: none;}}
+
+/* Main container styling */
+.main .block-container {{
+    padding-top: 2rem;
+    padding-left: 2rem;
+    padding-right: 2rem;
+    max-width: none;
+}}
+
+/* Header styling */
+.main-header {{
+    background: linear-gradient(135deg, {primary}, {secondary});
+    padding: 2rem;
+    border-radius: var(--r2);
+    margin-bottom: 2rem;
+    text-align: center;
+    box-shadow: 0 8px 32px rgba(0,0,0,0.3);
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255,255,255,0.1);
+}}
+
+.main-header h1 {{
+    color: {text_primary};
+    font-size: 2.5rem;
+    font-weight: 300;
+    margin: 0;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
+}}
+
+.main-header .subtitle {{
+    color: {text_secondary};
+    font-size: 1.1rem;
+    margin-top: 0.5rem;
+    opacity: 0.9;
+}}
+
+/* Weather card styling */
+.weather-card {{
+    background: rgba(255, 255, 255, 0.1);
+    backdrop-filter: blur(15px);
+    border-radius: 20px;
+    padding: 1.5rem;
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    margin-bottom: 1rem;
+    box-shadow: 0 8px 32px rgba(0,0,0,0.2);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}}
+
+.weather-card:hover {{
+    transform: translateY(-5px);
+    box-shadow: 0 12px 40px rgba(0,0,0,0.3);
+}}
+
+/* Button styling */
+.stButton > button {{
+    background: linear-gradient(45deg, {primary}, {secondary});
+    border: none;
+    color: white;
+    padding: 0.75rem 1.5rem;
+    border-radius: 25px;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    font-weight: 500;
+    box-shadow: 0 4px 15px {primary_03};
+}}
+
+.stButton > button:hover {{
+    transform: translateY(-2px);
+    box-shadow: 0 6px 20px {primary_04};
+    background: linear-gradient(45deg, {secondary}, {primary});
+}}
+
+.stButton > button:active {{
+    transform: translateY(0px);
+    box-shadow: 0 2px 10px {primary_03};
+}}
+
+/* Primary button specific styling */
+.stButton > button[kind="primary"] {{
+    background: linear-gradient(45deg, {accent}, {primary});
+    box-shadow: 0 4px 15px {accent_04};
+}}
+
+.stButton > button[kind="primary"]:hover {{
+    box-shadow: 0 6px 20px {accent_05};
+}}
+
+/* Selectbox and text input styling (identical declarations) */
+.stSelectbox > div > div > select,
+.stTextInput > div > div > input {{
+    background-color: rgba(255, 255, 255, 0.1);
+    color: {text_primary};
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: var(--r);
+}}
+
+.stTextInput > div > div > input:focus {{
+    border-color: {primary};
+    box-shadow: 0 0 10px {primary_03};
+}}
+
+/* Metric styling */
+.stMetric {{
+    background: var(--glass);
+    padding: 1rem;
+    border-radius: var(--r);
+    border: var(--gb);
+}}
+
+.stMetric > div {{
+    color: {text_primary};
+}}
+
+/* Expander styling */
+.streamlit-expanderHeader {{
+    background: var(--glass);
+    border-radius: var(--r);
+    border: var(--gb);
+}}
+
+/* Radio button styling */
+.stRadio > div {{
+    background: var(--glass);
+    padding: 1rem;
+    border-radius: var(--r);
+    border: var(--gb);
+}}
+
+/* Checkbox styling */
+.stCheckbox > label {{
+    color: {text_primary};
+}}
+
+/* Slider styling */
+.stSlider > div > div > div > div {{
+    background-color: {primary};
+}}
+
+/* Progress bar styling */
+.stProgress > div > div > div > div {{
+    background-color: {primary};
+}}
+
+/* Success, error, info, warning styling; shared shape, per-type colors */
+.stSuccess, .stError, .stInfo, .stWarning {{
+    border-radius: var(--r);
+}}
+
+.stSuccess {{
+    background-color: {success_01};
+    border: 1px solid {success};
+}}
+
+.stError {{
+    background-color: {error_01};
+    border: 1px solid {error};
+}}
+
+.stInfo {{
+    background-color: {info_01};
+    border: 1px solid {info};
+}}
+
+.stWarning {{
+    background-color: {warning_01};
+    border: 1px solid {warning};
+}}
+
+/* Sidebar styling */
+.css-1d391kg {{
+    background: var(--glass);
+    border-right: var(--gb);
+}}
+
+/* Animation classes */
+.fade-in {{
+    animation: fadeIn 0.5s ease-in;
+}}
+
+@keyframes fadeIn {{
+    from {{ opacity: 0; transform: translateY(20px); }}
+    to {{ opacity: 1; transform: translateY(0); }}
+}}
+
+.scale-in {{
+    animation: scaleIn 0.3s ease-out;
+}}
+
+@keyframes scaleIn {{
+    from {{ transform: scale(0.9); opacity: 0; }}
+    to {{ transform: scale(1); opacity: 1; }}
+}}
+
+/* Pulse animation, used by the status-online indicator dot */
+@keyframes pulse {{
+    0% {{ opacity: 1; }}
+    50% {{ opacity: 0.5; }}
+    100% {{ opacity: 1; }}
+}}
+
+/* Weather icon animations */
+.weather-icon {{
+    width: 80px;
+    height: 80px;
+    margin: 0 auto;
+    display: block;
+    filter: drop-shadow(0 2px 4px rgba(0,0,0,0.3));
+    transition: transform 0.3s ease;
+}}
+
+.weather-icon:hover {{
+    transform: scale(1.1);
+}}
+
+/* Status indicators; shared layout and dot shape, per-state colors */
+.status-online, .status-offline {{
+    display: inline-flex;
+    align-items: center;
+}}
+
+.status-online::before, .status-offline::before {{
+    content: '';
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+    margin-right: 0.5rem;
+}}
+
+.status-online {{
+    color: {success};
+}}
+
+.status-online::before {{
+    background-color: {success};
+    animation: pulse 2s infinite;
+}}
+
+.status-offline {{
+    color: {error};
+}}
+
+.status-offline::before {{
+    background-color: {error};
+}}
+
+/* Mobile responsiveness */
+@media (max-width: 768px) {{
+    .main .block-container {{
+        padding: 1rem;
+    }}
+    
+    .main-header {{
+        padding: 1.5rem;
+        margin-bottom: 1rem;
+    }}
+    
+    .main-header h1 {{
+        font-size: 2rem;
+    }}
+    
+    .weather-card {{
+        padding: 1rem;
+    }}
+}}
+
+/* Custom scrollbar */
+::-webkit-scrollbar {{
+    width: 8px;
+}}
+
+::-webkit-scrollbar-track {{
+    background: rgba(255, 255, 255, 0.1);
+    border-radius: 4px;
+}}
+
+::-webkit-scrollbar-thumb {{
+    background: {primary_06};
+    border-radius: 4px;
+}}
+
+::-webkit-scrollbar-thumb:hover {{
+    background: {primary_08};
+}}
+"""
+
+
+# Weather card template; palette keys and per-call data keys are filled in a
+# single format_map pass instead of rebuilding a multi-line f-string per call
+_CARD_TMPL = """
+<div class="weather-card scale-in">
+    <h3 style="margin-top: 0; color: {text_primary};">
+        🏙️ {city} Weather
+    </h3>
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <span style="font-size: 2.5rem; font-weight: 300; color: {accent};">
+                {temp}°C
+            </span>
+            <p style="color: {text_secondary}; margin: 0;">
+                Feels like {feels}°C
+            </p>
+        </div>
+        <div style="text-align: right;">
+            <img class="weather-icon" src="{icon}" alt="Weather icon">
+            <p style="color: {text_primary}; margin: 0.5rem 0 0 0;">
+                {weather}
+            </p>
+        </div>
+    </div>
+</div>
+"""
+
+
+class _KeepMissing(dict):
+    """format_map helper that leaves unknown placeholders in place."""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a CSS string."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,])\s*', r'\1', css)
+    return css.strip()
+
+
+def _rgba(hex_str: str, alpha: float) -> str:
+    """rgba() literal for a #RRGGBB hex color."""
+    r, g, b = (int(hex_str[i:i + 2], 16) for i in (1, 3, 5))
+    return f'rgba({r},{g},{b},{alpha})'
+
+
+@functools.lru_cache(maxsize=8)
+def _build_css(palette_items: tuple) -> str:
+    """
+    Format and minify the template for one palette.
+
+    Keyed on the sorted palette items so every StyleManager in the process
+    shares a single built blob per distinct palette. Alpha variants used by
+    shadows and glows are derived here so they track set_theme_color.
+    Minification runs after substitution: the whitespace pass must not see
+    the placeholders' braces, or it eats the space in front of them (e.g.
+    '15px {primary_03}' would collapse to '15pxrgba(...)').
+    """
+    palette = dict(palette_items)
+    palette.update({
+        'primary_03': _rgba(palette['primary'], 0.3),
+        'primary_04': _rgba(palette['primary'], 0.4),
+        'primary_06': _rgba(palette['primary'], 0.6),
+        'primary_08': _rgba(palette['primary'], 0.8),
+        'accent_04': _rgba(palette['accent'], 0.4),
+        'accent_05': _rgba(palette['accent'], 0.5),
+        'success_01': _rgba(palette['success'], 0.1),
+        'error_01': _rgba(palette['error'], 0.1),
+        'info_01': _rgba(palette['info'], 0.1),
+        'warning_01': _rgba(palette['warning'], 0.1),
+    })
+    return _minify_css(_CSS_TEMPLATE.format_map(palette))
+
+
 class StyleManager:
     """
     Manager for application styling and themes.
     """
-    
+
+    # Read-only view of the shared palette; all instances see the same
+    # backing dict, mutated only through set_theme_color
+    colors = _PALETTE_VIEW
+
     def __init__(self):
         """Initialize style manager."""
         self.logger = logging.getLogger(__name__)
-        
-        # Color palette
-        self.colors = {
-            # Primary colors
-            'primary': '#FF6B35',
-            'secondary': '#F7931E', 
-            'accent': '#FFD23F',
-            
-            # Background colors
-            'background_dark': '#0E1117',
-            'background_secondary': '#262730',
-            'background_light': '#FAFAFA',
-            
-            # Text colors
-            'text_primary': '#FAFAFA',
-            'text_secondary': '#CCCCCC',
-            'text_muted': '#888888',
-            
-            # Status colors
-            'success': '#00C851',
-            'warning': '#FF8800',
-            'error': '#FF4444',
-            'info': '#33B5E5',
-            
-            # Weather colors
-            'weather_clear': '#FFD700',
-            'weather_clouds': '#C0C0C0',
-            'weather_rain': '#4169E1',
-            'weather_snow': '#F0F8FF',
-            'weather_storm': '#8A2BE2'
-        }
+
+        # Built CSS, memoized until the palette changes; apply_custom_styles
+        # runs on every rerun and the palette is stable within a session
+        self._css_cache = None
+
+        # Whether the stylesheet could be written as a cacheable static asset
+        self._static_css_ok = False
+
+        # Palette colors change at most via set_theme_color, so bake them
+        # into the card template once; per-call formatting then only fills
+        # the weather data placeholders
+        self._card_tmpl = _CARD_TMPL.format_map(_KeepMissing(self.colors))
+
+        self._static_css_ok = self._write_static_css()
+
+    def _write_static_css(self) -> bool:
+        """
+        Write the minified stylesheet (plus a gzip sibling) as a static asset.
+
+        Returns:
+            True if the asset was written and can be linked
+        """
+        try:
+            css = _build_css(tuple(sorted(self.colors.items())))
+            _STATIC_DIR.mkdir(exist_ok=True)
+            _STATIC_CSS.write_text(css, encoding='utf-8')
+            # Precompressed copy for servers/CDNs that can negotiate it
+            gz_path = _STATIC_CSS.parent / (_STATIC_CSS.name + '.gz')
+            gz_path.write_bytes(gzip.compress(css.encode('utf-8'), compresslevel=9))
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to write static CSS asset: {str(e)}")
+            return False
     
     def get_custom_css(self) -> str:
         """
@@ -56,392 +522,14 @@ class StyleManager:
         Returns:
             CSS string
         """
+        if self._css_cache is not None:
+            return self._css_cache
+
         try:
-            css = f"""
-            <style>
-            /* Import Google Fonts */
-            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-            
-            /* Global Styles */
-            html, body, [class*="css"] {{
-                font-family: 'Inter', sans-serif;
-            }}
-            
-            /* Hide Streamlit default elements */
-            #MainMenu {{visibility: hidden;}}
-            .stDeployButton {{display:none;}}
-            footer {{visibility: hidden;}}
-            .stApp > header {{display: none;}}
-            
-            /* Main container styling */
-            .main .block-container {{
-                padding-top: 2rem;
-                padding-left: 2rem;
-                padding-right: 2rem;
-                max-width: none;
-            }}
-            
-            /* Header styling */
-            .main-header {{
-                background: linear-gradient(135deg, {self.colors['primary']}, {self.colors['secondary']});
-                padding: 2rem;
-                border-radius: 15px;
-                margin-bottom: 2rem;
-                text-align: center;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-                backdrop-filter: blur(10px);
-                border: 1px solid rgba(255,255,255,0.1);
-            }}
-            
-            .main-header h1 {{
-                color: {self.colors['text_primary']};
-                font-size: 2.5rem;
-                font-weight: 300;
-                margin: 0;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-            }}
-            
-            .main-header .subtitle {{
-                color: {self.colors['text_secondary']};
-                font-size: 1.1rem;
-                margin-top: 0.5rem;
-                opacity: 0.9;
-            }}
-            
-            /* Weather card styling */
-            .weather-card {{
-                background: rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(15px);
-                border-radius: 20px;
-                padding: 1.5rem;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                margin-bottom: 1rem;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.2);
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-            }}
-            
-            .weather-card:hover {{
-                transform: translateY(-5px);
-                box-shadow: 0 12px 40px rgba(0,0,0,0.3);
-            }}
-            
-            /* Search container styling */
-            .search-container {{
-                background: rgba(255, 255, 255, 0.05);
-                padding: 1.5rem;
-                border-radius: 15px;
-                margin-bottom: 1rem;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(10px);
-            }}
-            
-            /* Button styling */
-            .stButton > button {{
-                background: linear-gradient(45deg, {self.colors['primary']}, {self.colors['secondary']});
-                border: none;
-                color: white;
-                padding: 0.75rem 1.5rem;
-                border-radius: 25px;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                font-weight: 500;
-                box-shadow: 0 4px 15px rgba(255, 107, 53, 0.3);
-            }}
-            
-            .stButton > button:hover {{
-                transform: translateY(-2px);
-                box-shadow: 0 6px 20px rgba(255, 107, 53, 0.4);
-                background: linear-gradient(45deg, {self.colors['secondary']}, {self.colors['primary']});
-            }}
-            
-            .stButton > button:active {{
-                transform: translateY(0px);
-                box-shadow: 0 2px 10px rgba(255, 107, 53, 0.3);
-            }}
-            
-            /* Primary button specific styling */
-            .stButton > button[kind="primary"] {{
-                background: linear-gradient(45deg, {self.colors['accent']}, {self.colors['primary']});
-                box-shadow: 0 4px 15px rgba(255, 210, 63, 0.4);
-            }}
-            
-            .stButton > button[kind="primary"]:hover {{
-                box-shadow: 0 6px 20px rgba(255, 210, 63, 0.5);
-            }}
-            
-            /* Selectbox styling */
-            .stSelectbox > div > div > select {{
-                background-color: rgba(255, 255, 255, 0.1);
-                color: {self.colors['text_primary']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 10px;
-                backdrop-filter: blur(5px);
-            }}
-            
-            /* Text input styling */
-            .stTextInput > div > div > input {{
-                background-color: rgba(255, 255, 255, 0.1);
-                color: {self.colors['text_primary']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 10px;
-                backdrop-filter: blur(5px);
-            }}
-            
-            .stTextInput > div > div > input:focus {{
-                border-color: {self.colors['primary']};
-                box-shadow: 0 0 10px rgba(255, 107, 53, 0.3);
-            }}
-            
-            /* Metric styling */
-            .metric-container {{
-                background: rgba(255, 255, 255, 0.08);
-                padding: 1rem;
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                text-align: center;
-                backdrop-filter: blur(5px);
-            }}
-            
-            .stMetric {{
-                background: rgba(255, 255, 255, 0.05);
-                padding: 1rem;
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }}
-            
-            .stMetric > div {{
-                color: {self.colors['text_primary']};
-            }}
-            
-            /* Expander styling */
-            .streamlit-expanderHeader {{
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }}
-            
-            /* Radio button styling */
-            .stRadio > div {{
-                background: rgba(255, 255, 255, 0.05);
-                padding: 1rem;
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }}
-            
-            /* Checkbox styling */
-            .stCheckbox > label {{
-                color: {self.colors['text_primary']};
-            }}
-            
-            /* Slider styling */
-            .stSlider > div > div > div > div {{
-                background-color: {self.colors['primary']};
-            }}
-            
-            /* Progress bar styling */
-            .stProgress > div > div > div > div {{
-                background-color: {self.colors['primary']};
-            }}
-            
-            /* Success, error, info, warning styling */
-            .stSuccess {{
-                background-color: rgba(0, 200, 81, 0.1);
-                border: 1px solid {self.colors['success']};
-                border-radius: 10px;
-            }}
-            
-            .stError {{
-                background-color: rgba(255, 68, 68, 0.1);
-                border: 1px solid {self.colors['error']};
-                border-radius: 10px;
-            }}
-            
-            .stInfo {{
-                background-color: rgba(51, 181, 229, 0.1);
-                border: 1px solid {self.colors['info']};
-                border-radius: 10px;
-            }}
-            
-            .stWarning {{
-                background-color: rgba(255, 136, 0, 0.1);
-                border: 1px solid {self.colors['warning']};
-                border-radius: 10px;
-            }}
-            
-            /* Sidebar styling */
-            .css-1d391kg {{
-                background: rgba(255, 255, 255, 0.05);
-                backdrop-filter: blur(10px);
-                border-right: 1px solid rgba(255, 255, 255, 0.1);
-            }}
-            
-            /* Globe container styling */
-            .globe-container {{
-                background: rgba(0, 0, 0, 0.3);
-                border-radius: 15px;
-                padding: 1rem;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(10px);
-            }}
-            
-            /* Animation classes */
-            .fade-in {{
-                animation: fadeIn 0.5s ease-in;
-            }}
-            
-            @keyframes fadeIn {{
-                from {{ opacity: 0; transform: translateY(20px); }}
-                to {{ opacity: 1; transform: translateY(0); }}
-            }}
-            
-            .slide-in-left {{
-                animation: slideInLeft 0.5s ease-out;
-            }}
-            
-            @keyframes slideInLeft {{
-                from {{ transform: translateX(-100%); }}
-                to {{ transform: translateX(0); }}
-            }}
-            
-            .scale-in {{
-                animation: scaleIn 0.3s ease-out;
-            }}
-            
-            @keyframes scaleIn {{
-                from {{ transform: scale(0.9); opacity: 0; }}
-                to {{ transform: scale(1); opacity: 1; }}
-            }}
-            
-            /* Pulse animation for loading states */
-            .pulse {{
-                animation: pulse 2s infinite;
-            }}
-            
-            @keyframes pulse {{
-                0% {{ opacity: 1; }}
-                50% {{ opacity: 0.5; }}
-                100% {{ opacity: 1; }}
-            }}
-            
-            /* Weather icon animations */
-            .weather-icon {{
-                width: 80px;
-                height: 80px;
-                margin: 0 auto;
-                display: block;
-                filter: drop-shadow(0 2px 4px rgba(0,0,0,0.3));
-                transition: transform 0.3s ease;
-            }}
-            
-            .weather-icon:hover {{
-                transform: scale(1.1);
-            }}
-            
-            /* Status indicators */
-            .status-online {{
-                color: {self.colors['success']};
-                display: inline-flex;
-                align-items: center;
-            }}
-            
-            .status-online::before {{
-                content: '';
-                width: 8px;
-                height: 8px;
-                background-color: {self.colors['success']};
-                border-radius: 50%;
-                margin-right: 0.5rem;
-                animation: pulse 2s infinite;
-            }}
-            
-            .status-offline {{
-                color: {self.colors['error']};
-                display: inline-flex;
-                align-items: center;
-            }}
-            
-            .status-offline::before {{
-                content: '';
-                width: 8px;
-                height: 8px;
-                background-color: {self.colors['error']};
-                border-radius: 50%;
-                margin-right: 0.5rem;
-            }}
-            
-            /* Mobile responsiveness */
-            @media (max-width: 768px) {{
-                .main .block-container {{
-                    padding: 1rem;
-                }}
-                
-                .main-header {{
-                    padding: 1.5rem;
-                    margin-bottom: 1rem;
-                }}
-                
-                .main-header h1 {{
-                    font-size: 2rem;
-                }}
-                
-                .weather-card {{
-                    padding: 1rem;
-                }}
-            }}
-            
-            /* Custom scrollbar */
-            ::-webkit-scrollbar {{
-                width: 8px;
-            }}
-            
-            ::-webkit-scrollbar-track {{
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 4px;
-            }}
-            
-            ::-webkit-scrollbar-thumb {{
-                background: rgba(255, 107, 53, 0.6);
-                border-radius: 4px;
-            }}
-            
-            ::-webkit-scrollbar-thumb:hover {{
-                background: rgba(255, 107, 53, 0.8);
-            }}
-            
-            /* Tooltip styling */
-            .tooltip {{
-                position: relative;
-                display: inline-block;
-            }}
-            
-            .tooltip .tooltiptext {{
-                visibility: hidden;
-                width: 200px;
-                background-color: rgba(0, 0, 0, 0.8);
-                color: {self.colors['text_primary']};
-                text-align: center;
-                border-radius: 8px;
-                padding: 8px;
-                position: absolute;
-                z-index: 1;
-                bottom: 125%;
-                left: 50%;
-                margin-left: -100px;
-                opacity: 0;
-                transition: opacity 0.3s;
-                backdrop-filter: blur(10px);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }}
-            
-            .tooltip:hover .tooltiptext {{
-                visibility: visible;
-                opacity: 1;
-            }}
-            </style>
-            """
-            
+            css = '<style>' + _build_css(tuple(sorted(self.colors.items()))) + '</style>'
+            self._css_cache = css
             return css
-            
+
         except Exception as e:
             self.logger.error(f"Failed to generate custom CSS: {str(e)}")
             return "<style></style>"
@@ -453,16 +541,12 @@ class StyleManager:
         Returns:
             HTML string for header
         """
-        try:
-            return f"""
-            <div class="main-header fade-in">
-                <h1>🌍 Sky Globe</h1>
-                <p class="subtitle">Global Weather Visualization</p>
-            </div>
-            """
-        except Exception as e:
-            self.logger.error(f"Failed to generate header HTML: {str(e)}")
-            return "<div><h1>🌍 Sky Globe - Global Weather</h1></div>"
+        return """
+        <div class="main-header fade-in">
+            <h1>🌍 Sky Globe</h1>
+            <p class="subtitle">Global Weather Visualization</p>
+        </div>
+        """
     
     def get_weather_card_html(self, weather_data: Dict[str, Any], city_name: str) -> str:
         """
@@ -475,33 +559,13 @@ class StyleManager:
         Returns:
             HTML string for weather card
         """
-        try:
-            return f"""
-            <div class="weather-card scale-in">
-                <h3 style="margin-top: 0; color: {self.colors['text_primary']};">
-                    🏙️ {city_name} Weather
-                </h3>
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <span style="font-size: 2.5rem; font-weight: 300; color: {self.colors['accent']};">
-                            {weather_data.get('temperature', 'N/A')}°C
-                        </span>
-                        <p style="color: {self.colors['text_secondary']}; margin: 0;">
-                            Feels like {weather_data.get('feels_like', 'N/A')}°C
-                        </p>
-                    </div>
-                    <div style="text-align: right;">
-                        <img class="weather-icon" src="{weather_data.get('icon_url', '')}" alt="Weather icon">
-                        <p style="color: {self.colors['text_primary']}; margin: 0.5rem 0 0 0;">
-                            {weather_data.get('weather', 'N/A')}
-                        </p>
-                    </div>
-                </div>
-            </div>
-            """
-        except Exception as e:
-            self.logger.error(f"Failed to generate weather card HTML: {str(e)}")
-            return "<div class='weather-card'>Weather information unavailable</div>"
+        return self._card_tmpl.format_map({
+            'city': city_name,
+            'temp': weather_data.get('temperature', 'N/A'),
+            'feels': weather_data.get('feels_like', 'N/A'),
+            'icon': weather_data.get('icon_url', ''),
+            'weather': weather_data.get('weather', 'N/A')
+        })
     
     def get_status_indicator_html(self, status: bool, label: str) -> str:
         """
@@ -514,17 +578,41 @@ class StyleManager:
         Returns:
             HTML string for status indicator
         """
-        try:
-            css_class = "status-online" if status else "status-offline"
-            return f'<span class="{css_class}">{label}</span>'
-        except Exception as e:
-            self.logger.error(f"Failed to generate status indicator HTML: {str(e)}")
-            return f"<span>{label}</span>"
+        css_class = "status-online" if status else "status-offline"
+        return f'<span class="{css_class}">{label}</span>'
     
     def apply_custom_styles(self) -> None:
         """Apply custom styles to the Streamlit application."""
         try:
-            st.markdown(self.get_custom_css(), unsafe_allow_html=True)
+            # One injection per session; page setup is also guarded, so the
+            # stylesheet is not re-sent over the websocket on every rerun
+            if st.session_state.get('_styles_applied'):
+                return
+
+            # Inject into the parent document head via a zero-height
+            # component iframe; nodes added there survive reruns, unlike
+            # st.markdown output, so the one-per-session guard holds
+            if self._static_css_ok:
+                # Cacheable <link> instead of inlining the whole stylesheet
+                snippet = (
+                    "var l = parent.document.createElement('link');"
+                    "l.rel = 'stylesheet';"
+                    "l.href = 'app/static/skyglobe.css';"
+                    "parent.document.head.appendChild(l);"
+                )
+            else:
+                css = _build_css(tuple(sorted(self.colors.items())))
+                snippet = (
+                    "var s = parent.document.createElement('style');"
+                    "s.textContent = " + json.dumps(css) + ";"
+                    "parent.document.head.appendChild(s);"
+                )
+
+            components.html(
+                '<script>' + _FONT_SNIPPET + snippet + '</script>', height=0
+            )
+
+            st.session_state['_styles_applied'] = True
         except Exception as e:
             self.logger.error(f"Failed to apply custom styles: {str(e)}")
     
@@ -533,9 +621,9 @@ class StyleManager:
         Get current theme color palette.
         
         Returns:
-            Dictionary with color values
+            Read-only mapping with color values
         """
-        return self.colors.copy()
+        return _PALETTE_VIEW
     
     def set_theme_color(self, color_name: str, color_value: str) -> None:
         """
@@ -546,7 +634,10 @@ class StyleManager:
             color_value: Hex color value
         """
         try:
-            self.colors[color_name] = color_value
+            _PALETTE[color_name] = color_value
+            self._css_cache = None  # palette changed; rebuild on next use
+            self._card_tmpl = _CARD_TMPL.format_map(_KeepMissing(self.colors))
+            self._static_css_ok = self._write_static_css()
             self.logger.info(f"Theme color '{color_name}' set to '{color_value}'")
         except Exception as e:
             self.logger.error(f"Failed to set theme color: {str(e)}")
@@ -4,10 +4,32 @@ Configuration management module for Sky Globe application.
 Handles environment settings, API keys, and application constants.
 """
 
+from __future__ import annotations
+
 import os
-import streamlit as st
-from typing import Dict, Any, Optional
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+# Default data directory, resolved once at import instead of walking
+# Path(__file__).parent chains per Config instantiation
+_DATA_DIR = Path(__file__).resolve().parents[2] / 'data'
+
+
+@lru_cache(maxsize=4)
+def _check_data_files(data_dir: Path) -> Dict[str, bool]:
+    """
+    Stat the data files under a directory once per process.
+
+    Validation runs on every rerun for status banners; the files do not
+    appear or vanish mid-session, so the stat results are cached.
+    """
+    return {
+        'cities_data': (data_dir / 'cities.csv').exists(),
+        'countries_data': (data_dir / 'countries.csv').exists(),
+        'data_directory': data_dir.exists(),
+    }
 
 
 class Config:
@@ -32,6 +54,7 @@ class Config:
     # Application constants
     MIN_SEARCH_LENGTH = 2
     MAX_SEARCH_RESULTS = 20
+    UI_MAX_DROPDOWN = 50  # Hard cap on options rendered in a selectbox
     DEFAULT_CONTINENT_FILTER = "すべて"
     DEFAULT_CITY = "Tokyo"
     
@@ -80,11 +103,9 @@ class Config:
         custom_data_dir = os.getenv('DATA_DIR')
         if custom_data_dir:
             return Path(custom_data_dir)
-        
+
         # Default to data directory relative to project root
-        current_dir = Path(__file__).parent
-        project_root = current_dir.parent.parent
-        return project_root / 'data'
+        return _DATA_DIR
     
     def _load_api_keys(self) -> Dict[str, Optional[str]]:
         """
@@ -94,13 +115,21 @@ class Config:
             Dictionary containing API keys
         """
         api_keys = {}
-        
-        # OpenWeatherMap API key
-        api_keys['openweathermap'] = (
-            os.getenv('OPENWEATHERMAP_API_KEY') or
-            st.secrets.get('OPENWEATHERMAP_API_KEY') if 'OPENWEATHERMAP_API_KEY' in st.secrets else None
-        )
-        
+
+        # OpenWeatherMap API key; when the env var is set, st.secrets must
+        # not be touched at all — its first access stats and parses
+        # secrets.toml and raises when no secrets file exists
+        key = os.getenv('OPENWEATHERMAP_API_KEY')
+        if not key:
+            try:
+                # Deferred so non-UI importers (tests, CLI tools) don't pay
+                # the streamlit import cost just to read configuration
+                import streamlit as st
+                key = st.secrets.get('OPENWEATHERMAP_API_KEY')
+            except Exception:
+                key = None
+        api_keys['openweathermap'] = key
+
         return api_keys
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -169,18 +198,12 @@ class Config:
         Returns:
             Dictionary with validation results
         """
-        results = {}
-        
-        # Check data files
-        results['cities_data'] = self.get_cities_csv_path().exists()
-        results['countries_data'] = self.get_countries_csv_path().exists()
-        
+        # Data file and directory checks (cached stat calls)
+        results = dict(_check_data_files(self.data_dir))
+
         # Check API keys
         results['weather_api'] = self.get_api_key('openweathermap') is not None
-        
-        # Check data directory
-        results['data_directory'] = self.data_dir.exists()
-        
+
         return results
     
     def get_missing_requirements(self) -> list[str]:
@@ -205,5 +228,17 @@ class Config:
         return missing
 
 
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the process-wide Config instance.
+
+    Construction reads environment variables and Streamlit secrets (file
+    stat + TOML parse), so it is done once per process rather than per
+    session.
+    """
+    return Config()
+
+
 # Create global config instance
-config = Config()
\ No newline at end of file
+config = get_config()
\ No newline at end of file